@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: (Apache-2.0 OR MIT)
 # Copyright ijl (2018-2025)
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from flask import Flask
+from flask import Flask, Response, request
 
 import hyperjson
 
@@ -12,6 +14,8 @@ app = Flask(__name__)
 
 NOW = datetime.now(timezone.utc)
 
+EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 @app.route("/")
 def root():
@@ -22,10 +26,37 @@ def root():
     }
     payload = hyperjson.dumps(
         data,
-        option=hyperjson.OPT_NAIVE_UTC | hyperjson.OPT_OMIT_MICROSECONDS,
+        option=hyperjson.OPT_NAIVE_UTC
+        | hyperjson.OPT_OMIT_MICROSECONDS
+        | hyperjson.OPT_APPEND_NEWLINE,
+    )
+    # direct_passthrough hands the bytes straight to the WSGI layer
+    # instead of re-wrapping (and copying) them in response
+    # normalization; the newline is appended in Rust rather than by a
+    # second Python-side concatenation.
+    return Response(
+        payload,
+        status=200,
+        mimetype="application/json; charset=utf-8",
+        direct_passthrough=True,
+    )
+
+
+@app.route("/batch", methods=["POST"])
+def batch():
+    # hyperjson drops the GIL for the raw parse phase of loads (the
+    # input lines are immutable bytes); building the resulting Python
+    # objects still holds it, so the pool overlaps parsing across cores
+    # but materialization remains serialized.
+    lines = request.get_data().splitlines()
+    documents = list(EXECUTOR.map(hyperjson.loads, lines))
+    payload = hyperjson.dumps(
+        {"count": len(documents)},
+        option=hyperjson.OPT_APPEND_NEWLINE,
     )
-    return app.response_class(
-        response=payload,
+    return Response(
+        payload,
         status=200,
         mimetype="application/json; charset=utf-8",
+        direct_passthrough=True,
     )
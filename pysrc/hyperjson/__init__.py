@@ -7,10 +7,12 @@ from .hyperjson import __version__
 __all__ = (
     "__version__",
     "dumps",
+    "dumps_into",
     "Fragment",
     "JSONDecodeError",
     "JSONEncodeError",
     "loads",
+    "loads_tape",
     "OPT_APPEND_NEWLINE",
     "OPT_INDENT_2",
     "OPT_NAIVE_UTC",
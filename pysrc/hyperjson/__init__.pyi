@@ -11,7 +11,14 @@ def dumps(
     default: Callable[[Any], Any] | None = ...,
     option: int | None = ...,
 ) -> bytes: ...
+def dumps_into(
+    __obj: Any,
+    __buf: bytearray,
+    default: Callable[[Any], Any] | None = ...,
+    option: int | None = ...,
+) -> int: ...
 def loads(__obj: bytes | bytearray | memoryview | str) -> Any: ...
+def loads_tape(__obj: bytes | bytearray | memoryview | str) -> bytes: ...
 
 class JSONDecodeError(json.JSONDecodeError): ...
 class JSONEncodeError(TypeError): ...
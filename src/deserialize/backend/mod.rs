@@ -4,4 +4,4 @@
 mod ffi;
 mod yyjson;
 
-pub(crate) use yyjson::deserialize;
+pub(crate) use yyjson::{deserialize, deserialize_tape};
@@ -68,8 +68,38 @@ fn unsafe_yyjson_get_next_non_container(val: *mut yyjson_val) -> *mut yyjson_val
     unsafe { (val.cast::<u8>().add(YYJSON_VAL_SIZE)).cast::<yyjson_val>() }
 }
 
+/// Run the raw parse. It touches no Python state - the input slice is
+/// borrowed and the pool allocator was filled before the call - so when
+/// the caller vouches for the input buffer's stability (`release_gil`)
+/// the GIL is dropped for the duration of `yyjson_read_opts`.
+fn read_doc(
+    data: &'static str,
+    alloc: &yyjson_alc,
+    err: &mut yyjson_read_err,
+    release_gil: bool,
+) -> *mut yyjson_doc {
+    unsafe {
+        let tstate = if release_gil {
+            crate::ffi::PyEval_SaveThread()
+        } else {
+            null_mut()
+        };
+        let doc = yyjson_read_opts(
+            data.as_ptr().cast::<c_char>().cast_mut(),
+            data.len(),
+            alloc,
+            err,
+        );
+        if !tstate.is_null() {
+            crate::ffi::PyEval_RestoreThread(tstate);
+        }
+        doc
+    }
+}
+
 pub(crate) fn deserialize(
     data: &'static str,
+    release_gil: bool,
 ) -> Result<NonNull<crate::ffi::PyObject>, DeserializeError<'static>> {
     assume!(!data.is_empty());
     let buffer_capacity = buffer_capacity_to_allocate(data.len());
@@ -97,14 +127,7 @@ pub(crate) fn deserialize(
         pos: 0,
     };
 
-    let doc = unsafe {
-        yyjson_read_opts(
-            data.as_ptr().cast::<c_char>().cast_mut(),
-            data.len(),
-            &raw const alloc,
-            &raw mut err,
-        )
-    };
+    let doc = read_doc(data, &alloc, &mut err, release_gil);
     if doc.is_null() {
         ffi!(PyMem_Free(buffer_ptr));
         let msg: Cow<str> = unsafe { core::ffi::CStr::from_ptr(err.msg).to_string_lossy() };
@@ -144,6 +167,71 @@ pub(crate) fn deserialize(
     Ok(pyval)
 }
 
+pub(crate) fn deserialize_tape(
+    data: &'static str,
+    release_gil: bool,
+) -> Result<NonNull<crate::ffi::PyObject>, DeserializeError<'static>> {
+    assume!(!data.is_empty());
+    let buffer_capacity = buffer_capacity_to_allocate(data.len());
+    let buffer_ptr = ffi!(PyMem_Malloc(buffer_capacity));
+    if buffer_ptr.is_null() {
+        return Err(DeserializeError::from_yyjson(
+            Cow::Borrowed("Not enough memory to allocate buffer for parsing"),
+            0,
+            data,
+        ));
+    }
+    let mut alloc = yyjson_alc {
+        malloc: None,
+        realloc: None,
+        free: None,
+        ctx: null_mut(),
+    };
+    unsafe {
+        yyjson_alc_pool_init(&raw mut alloc, buffer_ptr, buffer_capacity);
+    }
+
+    let mut err = yyjson_read_err {
+        code: YYJSON_READ_SUCCESS,
+        msg: null(),
+        pos: 0,
+    };
+
+    let doc = read_doc(data, &alloc, &mut err, release_gil);
+    if doc.is_null() {
+        ffi!(PyMem_Free(buffer_ptr));
+        let msg: Cow<str> = unsafe { core::ffi::CStr::from_ptr(err.msg).to_string_lossy() };
+        return Err(DeserializeError::from_yyjson(msg, err.pos as i64, data));
+    }
+    // The values are laid out contiguously from the root: one tagged
+    // 16-byte entry per JSON value, with container entries carrying the
+    // offset of their sibling. String entries hold pointers into the
+    // document's string pool, which is freed below; rewrite them as
+    // offsets from the pool base so the tape is deterministic across
+    // calls and leaks no heap addresses. No per-value Python object is
+    // materialized.
+    let root = yyjson_doc_get_root(doc);
+    let val_count = unsafe { (*doc).val_read };
+    let str_pool = unsafe { (*doc).str_pool };
+    for i in 0..val_count {
+        let val = unsafe { root.add(i) };
+        if is_yyjson_tag!(val, TAG_STRING) {
+            unsafe {
+                #[allow(clippy::cast_sign_loss)]
+                let ofs = (*val).uni.str_.offset_from(str_pool) as usize;
+                (*val).uni.ofs = ofs;
+            }
+        }
+    }
+    let tape_len = val_count * YYJSON_VAL_SIZE;
+    let pyval = nonnull!(ffi!(PyBytes_FromStringAndSize(
+        root.cast::<c_char>(),
+        usize_to_isize(tape_len)
+    )));
+    ffi!(PyMem_Free(buffer_ptr));
+    Ok(pyval)
+}
+
 enum ElementType {
     String,
     Uint64,
@@ -6,6 +6,16 @@ use crate::deserialize::utf8::read_input_to_buf;
 // EMPTY_UNICODE now accessed via typeref::get_empty_unicode()
 use core::ptr::NonNull;
 
+/// Whether the input's buffer remains valid with the GIL released. bytes
+/// and str are immutable and the caller's frame keeps a reference alive;
+/// bytearray and memoryview contents can be resized or released by
+/// another thread, so those parses must keep the GIL.
+fn buffer_is_immutable(ptr: *mut crate::ffi::PyObject) -> bool {
+    let obj_type_ptr = ob_type!(ptr);
+    is_type!(obj_type_ptr, crate::typeref::get_bytes_type())
+        || is_type!(obj_type_ptr, crate::typeref::get_str_type())
+}
+
 pub(crate) fn deserialize(
     ptr: *mut crate::ffi::PyObject,
 ) -> Result<NonNull<crate::ffi::PyObject>, DeserializeError<'static>> {
@@ -26,5 +36,17 @@ pub(crate) fn deserialize(
 
     let buffer_str = unsafe { core::str::from_utf8_unchecked(buffer) };
 
-    crate::deserialize::backend::deserialize(buffer_str)
+    crate::deserialize::backend::deserialize(buffer_str, buffer_is_immutable(ptr))
+}
+
+pub(crate) fn deserialize_tape(
+    ptr: *mut crate::ffi::PyObject,
+) -> Result<NonNull<crate::ffi::PyObject>, DeserializeError<'static>> {
+    debug_assert!(ffi!(Py_REFCNT(ptr)) >= 1);
+    let buffer = read_input_to_buf(ptr)?;
+    debug_assert!(!buffer.is_empty());
+
+    let buffer_str = unsafe { core::str::from_utf8_unchecked(buffer) };
+
+    crate::deserialize::backend::deserialize_tape(buffer_str, buffer_is_immutable(ptr))
 }
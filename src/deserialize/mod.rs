@@ -11,5 +11,5 @@ mod utf8;
 
 #[cfg(not(Py_GIL_DISABLED))]
 pub(crate) use cache::{KEY_MAP, KeyMap};
-pub(crate) use deserializer::deserialize;
+pub(crate) use deserializer::{deserialize, deserialize_tape};
 pub(crate) use error::DeserializeError;
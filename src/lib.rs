@@ -88,16 +88,17 @@ mod typeref;
 use core::ffi::{c_char, c_int, c_void};
 use core::ptr::{NonNull, null, null_mut};
 
-use crate::deserialize::deserialize;
+use crate::deserialize::{deserialize, deserialize_tape};
 use crate::exception::{
     raise_dumps_exception_dynamic, raise_dumps_exception_fixed, raise_loads_exception,
 };
 use crate::ffi::{
-    METH_KEYWORDS, METH_O, Py_SIZE, Py_ssize_t, PyCFunction_NewEx, PyLong_AsLong, PyMethodDef,
+    METH_KEYWORDS, METH_O, Py_SIZE, Py_ssize_t, PyCFunction_NewEx, PyLong_AsLong,
+    PyLong_FromLongLong, PyMethodDef,
     PyMethodDefPointer, PyModuleDef, PyModuleDef_HEAD_INIT, PyModuleDef_Slot, PyObject,
     PyUnicode_FromStringAndSize, PyUnicode_InternFromString, PyVectorcall_NARGS,
 };
-use crate::serialize::serialize;
+use crate::serialize::{serialize, serialize_into};
 use crate::util::{isize_to_usize, usize_to_isize};
 
 #[cfg(Py_3_13)]
@@ -174,6 +175,29 @@ pub(crate) unsafe extern "C" fn orjson_init_exec(mptr: *mut PyObject) -> c_int {
             add!(mptr, c"dumps", func);
         }
 
+        {
+            let dumps_into_doc = c"dumps_into(obj, buf, /, default=None, option=None)\n--\n\nSerialize Python objects to JSON into a caller-supplied bytearray, returning the number of bytes written.";
+
+            let wrapped_dumps_into = Box::new(PyMethodDef {
+                ml_name: c"dumps_into".as_ptr(),
+                ml_meth: PyMethodDefPointer {
+                    #[cfg(Py_3_10)]
+                    PyCFunctionFastWithKeywords: dumps_into,
+                    #[cfg(not(Py_3_10))]
+                    _PyCFunctionFastWithKeywords: dumps_into,
+                },
+                ml_flags: crate::ffi::METH_FASTCALL | METH_KEYWORDS,
+                ml_doc: dumps_into_doc.as_ptr(),
+            });
+
+            let func = PyCFunction_NewEx(
+                Box::into_raw(wrapped_dumps_into),
+                null_mut(),
+                PyUnicode_InternFromString(c"hyperjson".as_ptr()),
+            );
+            add!(mptr, c"dumps_into", func);
+        }
+
         {
             let loads_doc = c"loads(obj, /)\n--\n\nDeserialize JSON to Python objects.";
 
@@ -191,6 +215,25 @@ pub(crate) unsafe extern "C" fn orjson_init_exec(mptr: *mut PyObject) -> c_int {
             add!(mptr, c"loads", func);
         }
 
+        {
+            let loads_tape_doc = c"loads_tape(obj, /)\n--\n\nParse JSON to a flat tape of tagged 16-byte entries without materializing Python objects. String entries hold offsets into the parser's string pool, not the string bytes themselves.";
+
+            let wrapped_loads_tape = Box::new(PyMethodDef {
+                ml_name: c"loads_tape".as_ptr(),
+                ml_meth: PyMethodDefPointer {
+                    PyCFunction: loads_tape,
+                },
+                ml_flags: METH_O,
+                ml_doc: loads_tape_doc.as_ptr(),
+            });
+            let func = PyCFunction_NewEx(
+                Box::into_raw(wrapped_loads_tape),
+                null_mut(),
+                PyUnicode_InternFromString(c"hyperjson".as_ptr()),
+            );
+            add!(mptr, c"loads_tape", func);
+        }
+
         add!(mptr, c"Fragment", typeref::get_fragment_type().cast::<PyObject>());
 
         opt!(mptr, c"OPT_APPEND_NEWLINE", opt::APPEND_NEWLINE);
@@ -223,7 +266,7 @@ pub(crate) unsafe extern "C" fn orjson_init_exec(mptr: *mut PyObject) -> c_int {
 #[unsafe(no_mangle)]
 #[cold]
 #[cfg_attr(feature = "optimize", optimize(size))]
-pub(crate) unsafe extern "C" fn PyInit_orjson() -> *mut PyModuleDef {
+pub(crate) unsafe extern "C" fn PyInit_hyperjson() -> *mut PyModuleDef {
     #[cfg(not(Py_3_12))]
     const PYMODULEDEF_LEN: usize = 2;
     #[cfg(all(Py_3_12, not(Py_3_13)))]
@@ -275,6 +318,14 @@ pub(crate) unsafe extern "C" fn loads(_self: *mut PyObject, obj: *mut PyObject)
     deserialize(obj).map_or_else(raise_loads_exception, NonNull::as_ptr)
 }
 
+#[unsafe(no_mangle)]
+pub(crate) unsafe extern "C" fn loads_tape(
+    _self: *mut PyObject,
+    obj: *mut PyObject,
+) -> *mut PyObject {
+    deserialize_tape(obj).map_or_else(raise_loads_exception, NonNull::as_ptr)
+}
+
 #[cfg(CPython)]
 macro_rules! matches_kwarg {
     ($val:expr, $ref:expr) => {
@@ -367,3 +418,90 @@ pub(crate) unsafe extern "C" fn dumps(
         )
     }
 }
+
+#[allow(non_snake_case)]
+#[unsafe(no_mangle)]
+#[cfg_attr(not(Py_3_10), allow(deprecated))] // _PyCFunctionFastWithKeywords
+pub(crate) unsafe extern "C" fn dumps_into(
+    _self: *mut PyObject,
+    args: *const *mut PyObject,
+    nargs: Py_ssize_t,
+    kwnames: *mut PyObject,
+) -> *mut PyObject {
+    unsafe {
+        let mut default: Option<NonNull<PyObject>> = None;
+        let mut optsptr: Option<NonNull<PyObject>> = None;
+
+        let num_args = PyVectorcall_NARGS(isize_to_usize(nargs));
+        if num_args < 2 {
+            cold_path!();
+            return raise_dumps_exception_fixed(
+                "dumps_into() missing 2 required positional arguments: 'obj' and 'buf'",
+            );
+        }
+        if num_args >= 3 {
+            default = Some(NonNull::new_unchecked(*args.offset(2)));
+        }
+        if num_args >= 4 {
+            optsptr = Some(NonNull::new_unchecked(*args.offset(3)));
+        }
+        if !kwnames.is_null() {
+            cold_path!();
+            for i in 0..=Py_SIZE(kwnames).saturating_sub(1) {
+                let arg = crate::ffi::PyTuple_GET_ITEM(kwnames, i as Py_ssize_t);
+                if matches_kwarg!(arg, typeref::get_option()) {
+                    if num_args >= 4 {
+                        cold_path!();
+                        return raise_dumps_exception_fixed(
+                            "dumps_into() got multiple values for argument: 'option'",
+                        );
+                    }
+                    optsptr = Some(NonNull::new_unchecked(*args.offset(num_args + i)));
+                } else if matches_kwarg!(arg, typeref::get_default()) {
+                    if num_args >= 3 {
+                        cold_path!();
+                        return raise_dumps_exception_fixed(
+                            "dumps_into() got multiple values for argument: 'default'",
+                        );
+                    }
+                    default = Some(NonNull::new_unchecked(*args.offset(num_args + i)));
+                } else {
+                    return raise_dumps_exception_fixed(
+                        "dumps_into() got an unexpected keyword argument",
+                    );
+                }
+            }
+        }
+
+        let buf = *args.offset(1);
+        if !core::ptr::eq((*buf).ob_type, typeref::get_bytearray_type()) {
+            cold_path!();
+            return raise_dumps_exception_fixed("dumps_into() buf must be a bytearray");
+        }
+
+        let mut optsbits: i32 = 0;
+        if let Some(opts) = optsptr {
+            cold_path!();
+            if core::ptr::eq((*opts.as_ptr()).ob_type, typeref::get_int_type()) {
+                #[allow(clippy::cast_possible_truncation)]
+                let tmp = PyLong_AsLong(optsptr.unwrap().as_ptr()) as i32; // stmt_expr_attributes
+                optsbits = tmp;
+                if !(0..=opt::MAX_OPT).contains(&optsbits) {
+                    cold_path!();
+                    return raise_dumps_exception_fixed("Invalid opts");
+                }
+            } else if !core::ptr::eq(opts.as_ptr(), typeref::get_none()) {
+                cold_path!();
+                return raise_dumps_exception_fixed("Invalid opts");
+            }
+        }
+
+        #[allow(clippy::cast_sign_loss)]
+        let opts = optsbits as opt::Opt;
+
+        match serialize_into(*args, buf, default, opts) {
+            Ok(len) => PyLong_FromLongLong(usize_to_isize(len) as i64),
+            Err(err) => raise_dumps_exception_dynamic(err.as_str()),
+        }
+    }
+}
@@ -10,7 +10,7 @@ use crate::serialize::per_type::{
     StrSubclassSerializer, Time, UUID, ZeroListSerializer,
 };
 use crate::serialize::state::SerializerState;
-use crate::serialize::writer::{BytesWriter, to_writer, to_writer_pretty};
+use crate::serialize::writer::{BytesWriter, PyByteArrayWriter, to_writer, to_writer_pretty};
 use core::ptr::NonNull;
 use serde::ser::{Serialize, Serializer};
 
@@ -35,6 +35,28 @@ pub(crate) fn serialize(
     }
 }
 
+pub(crate) fn serialize_into(
+    ptr: *mut crate::ffi::PyObject,
+    buf: *mut crate::ffi::PyObject,
+    default: Option<NonNull<crate::ffi::PyObject>>,
+    opts: Opt,
+) -> Result<usize, String> {
+    let mut writer = PyByteArrayWriter::new(buf)?;
+    let obj = PyObjectSerializer::new(ptr, SerializerState::new(opts), default);
+    let res = if opt_disabled!(opts, INDENT_2) {
+        to_writer(&mut writer, &obj)
+    } else {
+        to_writer_pretty(&mut writer, &obj)
+    };
+    match res {
+        Ok(()) => writer.finish(opt_enabled!(opts, APPEND_NEWLINE)),
+        Err(err) => {
+            writer.abort();
+            Err(err.to_string())
+        }
+    }
+}
+
 pub(crate) struct PyObjectSerializer {
     pub ptr: *mut crate::ffi::PyObject,
     pub state: SerializerState,
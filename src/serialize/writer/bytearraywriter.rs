@@ -0,0 +1,228 @@
+// SPDX-License-Identifier: (Apache-2.0 OR MIT)
+// Copyright ijl (2020-2025)
+
+use crate::ffi::{PyByteArray_AsString, PyByteArray_Resize, PyByteArrayObject, PyObject};
+use crate::serialize::writer::WriteExt;
+use crate::util::{isize_to_usize, usize_to_isize};
+use bytes::{BufMut, buf::UninitSlice};
+use core::mem::MaybeUninit;
+
+const BUFFER_LENGTH: usize = 1024;
+
+const CANNOT_RESIZE: &str = "dumps_into() buf cannot be resized while it has an exported buffer";
+
+const BUF_MUTATED: &str = "dumps_into() buf must not be mutated during serialization";
+
+/// Writes serialized output into a caller-supplied bytearray, reusing its
+/// allocation across calls instead of creating a fresh bytes object.
+///
+/// Unlike bytes, a bytearray can legally refuse to resize: any exported
+/// buffer (e.g. a live memoryview) makes `PyByteArray_Resize` raise
+/// `BufferError`. An export existing up front fails in `new()`; one
+/// created mid-serialization (by a `default` hook) diverts remaining
+/// writes into an owned scratch buffer so they stay in bounds, and the
+/// error surfaces from `finish()`. A `default` hook can also resize the
+/// bytearray itself, reallocating or freeing the allocation behind the
+/// cached pointer, so `reserve` revalidates the cache and diverts the
+/// same way on a mismatch.
+pub(crate) struct PyByteArrayWriter {
+    cap: usize,
+    len: usize,
+    obj: *mut PyObject,
+    buf: *mut u8,
+    fallback: Option<Vec<u8>>,
+    failure: Option<&'static str>,
+}
+
+impl PyByteArrayWriter {
+    pub fn new(obj: *mut PyObject) -> Result<Self, String> {
+        if unsafe { (*obj.cast::<PyByteArrayObject>()).ob_exports } != 0 {
+            cold_path!();
+            return Err(String::from(CANNOT_RESIZE));
+        }
+        let mut writer = PyByteArrayWriter {
+            cap: isize_to_usize(ffi!(PyByteArray_Size(obj))),
+            len: 0,
+            obj: obj,
+            buf: unsafe { PyByteArray_AsString(obj).cast::<u8>() },
+            fallback: None,
+            failure: None,
+        };
+        if writer.cap < BUFFER_LENGTH && !writer.resize(BUFFER_LENGTH) {
+            return Err(String::from(CANNOT_RESIZE));
+        }
+        Ok(writer)
+    }
+
+    pub fn abort(&mut self) {
+        self.len = 0;
+        if self.fallback.is_none() {
+            // Best-effort cleanup; a failure here leaves the bytearray's
+            // length unchanged, which is safe.
+            let _ = self.resize(0);
+        }
+    }
+
+    #[inline]
+    pub fn finish(&mut self, append: bool) -> Result<usize, String> {
+        if append {
+            unsafe {
+                core::ptr::write(self.buffer_ptr(), b'\n');
+            }
+            self.len += 1;
+        }
+        if let Some(msg) = self.failure {
+            cold_path!();
+            return Err(String::from(msg));
+        }
+        if !self.resize(self.len) {
+            cold_path!();
+            return Err(String::from(CANNOT_RESIZE));
+        }
+        Ok(self.len)
+    }
+
+    #[inline]
+    fn buffer_ptr(&self) -> *mut u8 {
+        debug_assert!(!self.buf.is_null());
+        unsafe { self.buf.add(self.len) }
+    }
+
+    /// Resize the bytearray, returning whether it succeeded. On failure
+    /// `cap` and `buf` are left untouched and the pending Python
+    /// exception is cleared; the caller reports the error instead.
+    #[inline]
+    pub fn resize(&mut self, len: usize) -> bool {
+        unsafe {
+            if PyByteArray_Resize(self.obj, usize_to_isize(len)) != 0 {
+                cold_path!();
+                ffi!(PyErr_Clear());
+                return false;
+            }
+            self.cap = len;
+            self.buf = PyByteArray_AsString(self.obj).cast::<u8>();
+        }
+        true
+    }
+
+    #[cold]
+    #[inline(never)]
+    fn grow(&mut self, len: usize) {
+        let mut cap = self.cap;
+        while len >= cap {
+            cap *= 2;
+        }
+        if self.fallback.is_none() && self.resize(cap) {
+            return;
+        }
+        // The bytearray acquired an exported buffer mid-serialization:
+        // spill into an owned scratch buffer so the remaining writes
+        // stay in bounds, and fail in finish().
+        let mut vec = self.fallback.take().unwrap_or_else(|| {
+            unsafe { core::slice::from_raw_parts(self.buf, self.len) }.to_vec()
+        });
+        vec.resize(cap, 0);
+        self.cap = cap;
+        self.buf = vec.as_mut_ptr();
+        self.fallback = Some(vec);
+        if self.failure.is_none() {
+            self.failure = Some(CANNOT_RESIZE);
+        }
+    }
+
+    /// The bytearray was resized behind the writer's back: divert the
+    /// remaining writes into an owned scratch buffer sized to the
+    /// current logical capacity, and fail in finish(). The written
+    /// prefix is copied only as far as it survived the resize; the
+    /// output is discarded anyway.
+    #[cold]
+    #[inline(never)]
+    fn divert(&mut self) {
+        let size = isize_to_usize(ffi!(Py_SIZE(self.obj)));
+        let valid = core::cmp::min(self.len, size);
+        let current = unsafe { PyByteArray_AsString(self.obj).cast::<u8>().cast_const() };
+        let mut vec = unsafe { core::slice::from_raw_parts(current, valid) }.to_vec();
+        vec.resize(core::cmp::max(self.cap, self.len), 0);
+        self.cap = vec.len();
+        self.buf = vec.as_mut_ptr();
+        self.fallback = Some(vec);
+        self.failure = Some(BUF_MUTATED);
+    }
+}
+
+unsafe impl BufMut for PyByteArrayWriter {
+    #[inline]
+    unsafe fn advance_mut(&mut self, cnt: usize) {
+        self.len += cnt;
+    }
+
+    #[inline]
+    fn chunk_mut(&mut self) -> &mut UninitSlice {
+        unsafe {
+            UninitSlice::uninit(core::slice::from_raw_parts_mut(
+                self.buffer_ptr().cast::<MaybeUninit<u8>>(),
+                self.remaining_mut(),
+            ))
+        }
+    }
+
+    #[inline]
+    fn remaining_mut(&self) -> usize {
+        self.cap - self.len
+    }
+
+    #[inline]
+    fn put_u8(&mut self, value: u8) {
+        debug_assert!(self.remaining_mut() > 1);
+        unsafe {
+            core::ptr::write(self.buffer_ptr(), value);
+            self.advance_mut(1);
+        }
+    }
+
+    #[inline]
+    fn put_bytes(&mut self, val: u8, cnt: usize) {
+        debug_assert!(self.remaining_mut() > cnt);
+        unsafe {
+            core::ptr::write_bytes(self.buffer_ptr(), val, cnt);
+            self.advance_mut(cnt);
+        };
+    }
+
+    #[inline]
+    fn put_slice(&mut self, src: &[u8]) {
+        debug_assert!(self.remaining_mut() > src.len());
+        unsafe {
+            core::ptr::copy_nonoverlapping(src.as_ptr(), self.buffer_ptr(), src.len());
+            self.advance_mut(src.len());
+        }
+    }
+}
+
+impl WriteExt for &mut PyByteArrayWriter {
+    #[inline(always)]
+    fn as_mut_buffer_ptr(&mut self) -> *mut u8 {
+        self.buffer_ptr()
+    }
+
+    #[inline(always)]
+    fn reserve(&mut self, len: usize) {
+        // A default hook can run arbitrary Python between writes and
+        // resize the destination bytearray, moving or freeing the
+        // allocation behind the cached pointer without any buffer
+        // export. Revalidate the cache before relying on it.
+        if self.fallback.is_none() {
+            let ob_start =
+                unsafe { (*self.obj.cast::<PyByteArrayObject>()).ob_start.cast::<u8>() };
+            if ob_start != self.buf || isize_to_usize(ffi!(Py_SIZE(self.obj))) != self.cap {
+                cold_path!();
+                self.divert();
+            }
+        }
+        let end_length = self.len + len;
+        if end_length >= self.cap {
+            cold_path!();
+            self.grow(end_length);
+        }
+    }
+}
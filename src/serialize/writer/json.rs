@@ -603,6 +603,9 @@ where
     }
 }
 
+#[cfg(all(target_arch = "x86_64", feature = "avx512"))]
+const STR_FORMATTER_SHORT_CUTOFF: usize = 32;
+
 #[cfg(all(target_arch = "x86_64", feature = "avx512"))]
 #[inline(always)]
 fn format_escaped_str<W>(writer: &mut W, value: &str)
@@ -612,11 +615,23 @@ where
     unsafe {
         reserve_str!(writer, value);
 
-        let written = STR_FORMATTER_FN(
-            writer.as_mut_buffer_ptr(),
-            value.as_bytes().as_ptr(),
-            value.len(),
-        );
+        // Inputs below one 256-bit stride cannot amortize the wide-vector
+        // setup: dispatch on length as well as CPUID and route them through
+        // the 128-bit implementation, which itself degrades to scalar below
+        // one 128-bit stride.
+        let written = if value.len() < STR_FORMATTER_SHORT_CUTOFF {
+            crate::serialize::writer::str::format_escaped_str_impl_sse2_128(
+                writer.as_mut_buffer_ptr(),
+                value.as_bytes().as_ptr(),
+                value.len(),
+            )
+        } else {
+            STR_FORMATTER_FN(
+                writer.as_mut_buffer_ptr(),
+                value.as_bytes().as_ptr(),
+                value.len(),
+            )
+        };
 
         writer.advance_mut(written);
     }
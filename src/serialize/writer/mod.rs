@@ -1,10 +1,12 @@
 // SPDX-License-Identifier: (Apache-2.0 OR MIT)
 // Copyright ijl (2024-2025)
 
+mod bytearraywriter;
 mod byteswriter;
 mod formatter;
 mod json;
 mod str;
 
+pub(crate) use bytearraywriter::PyByteArrayWriter;
 pub(crate) use byteswriter::{BytesWriter, WriteExt};
 pub(crate) use json::{set_str_formatter_fn, to_writer, to_writer_pretty};
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+# Copyright ijl (2025)
+
+import uuid
+
+import pytest
+
+import orjson
+
+
+class TestDumpsInto:
+    def test_basic(self):
+        """
+        dumps_into() writes dumps() output and returns the length
+        """
+        obj = {"key": ["value", 1, 2.5, None, True]}
+        buf = bytearray()
+        n = orjson.dumps_into(obj, buf)
+        assert isinstance(n, int)
+        assert n == len(buf)
+        assert bytes(buf) == orjson.dumps(obj)
+
+    def test_grow(self):
+        """
+        dumps_into() grows a buffer smaller than the output
+        """
+        obj = list(range(10000))
+        buf = bytearray(8)
+        n = orjson.dumps_into(obj, buf)
+        assert bytes(buf[:n]) == orjson.dumps(obj)
+
+    def test_shrink(self):
+        """
+        dumps_into() shrinks the buffer to the output on reuse
+        """
+        buf = bytearray()
+        orjson.dumps_into(list(range(1000)), buf)
+        n = orjson.dumps_into([], buf)
+        assert n == 2
+        assert bytes(buf) == b"[]"
+
+    def test_option(self):
+        """
+        dumps_into() option
+        """
+        buf = bytearray()
+        orjson.dumps_into([], buf, option=orjson.OPT_APPEND_NEWLINE)
+        assert bytes(buf) == b"[]\n"
+
+    def test_default(self):
+        """
+        dumps_into() default
+        """
+        ref = uuid.uuid4()
+        buf = bytearray()
+        orjson.dumps_into(ref, buf, default=str)
+        assert bytes(buf) == orjson.dumps(ref, default=str)
+
+    def test_buf_type(self):
+        """
+        dumps_into() buf must be a bytearray
+        """
+        for buf in (b"", memoryview(bytearray()), [], None):
+            with pytest.raises(orjson.JSONEncodeError):
+                orjson.dumps_into([], buf)
+
+    def test_missing_args(self):
+        """
+        dumps_into() missing positional arguments
+        """
+        with pytest.raises(TypeError):
+            orjson.dumps_into([])
+
+    def test_unexpected_kwarg(self):
+        """
+        dumps_into() unexpected keyword argument
+        """
+        with pytest.raises(TypeError):
+            orjson.dumps_into([], bytearray(), zxc=True)
+
+    def test_exported_buffer(self):
+        """
+        dumps_into() buf with an exported buffer errors, not crashes
+        """
+        buf = bytearray(8)
+        view = memoryview(buf)
+        with pytest.raises(orjson.JSONEncodeError):
+            orjson.dumps_into(list(range(10000)), buf)
+        assert len(buf) == 8
+        view.release()
+        n = orjson.dumps_into([], buf)
+        assert bytes(buf[:n]) == b"[]"
+
+    def test_default_mutates_buf(self):
+        """
+        dumps_into() default hook resizing buf errors, not crashes
+        """
+        buf = bytearray()
+
+        def default(obj):
+            buf.extend(b"x" * 262144)
+            del buf[:]
+            return "ok"
+
+        with pytest.raises(orjson.JSONEncodeError) as exc_info:
+            orjson.dumps_into([object(), "tail"], buf, default=default)
+        assert (
+            str(exc_info.value)
+            == "dumps_into() buf must not be mutated during serialization"
+        )
+        n = orjson.dumps_into([], buf)
+        assert bytes(buf[:n]) == b"[]"
+
+    def test_reuse_after_error(self):
+        """
+        dumps_into() buf is reusable after a serialization error
+        """
+        buf = bytearray()
+        with pytest.raises(orjson.JSONEncodeError):
+            orjson.dumps_into(object(), buf)
+        assert len(buf) == 0
+        n = orjson.dumps_into({"key": "value"}, buf)
+        assert bytes(buf[:n]) == b'{"key":"value"}'
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: (Apache-2.0 OR MIT)
+# Copyright ijl (2025)
+
+import struct
+
+import pytest
+
+import orjson
+
+VAL_SIZE = 16
+
+TAG_NULL = 0b00000010
+TAG_FALSE = 0b00000011
+TAG_TRUE = 0b00001011
+TAG_UINT64 = 0b00000100
+TAG_INT64 = 0b00001100
+TAG_DOUBLE = 0b00010100
+TAG_STRING = 0b00000101
+TAG_ARRAY = 0b00000110
+TAG_OBJECT = 0b00000111
+
+
+def entries(tape):
+    assert len(tape) % VAL_SIZE == 0
+    return [
+        struct.unpack_from("<QQ", tape, pos) for pos in range(0, len(tape), VAL_SIZE)
+    ]
+
+
+class TestTape:
+    def test_scalar(self):
+        """
+        loads_tape() scalar document is one tagged entry
+        """
+        tape = orjson.loads_tape(b"7")
+        assert isinstance(tape, bytes)
+        ((tag, uni),) = entries(tape)
+        assert tag & 0xFF == TAG_UINT64
+        assert uni == 7
+
+    def test_entry_per_value(self):
+        """
+        loads_tape() one entry per JSON value, container length in the tag
+        """
+        tape = orjson.loads_tape(b"[1, 2, 3]")
+        parsed = entries(tape)
+        assert len(parsed) == 4
+        root_tag, _ = parsed[0]
+        assert root_tag & 0xFF == TAG_ARRAY
+        assert root_tag >> 8 == 3
+        assert [uni for _, uni in parsed[1:]] == [1, 2, 3]
+
+    def test_object(self):
+        """
+        loads_tape() object entries are key, value pairs after the root
+        """
+        tape = orjson.loads_tape(b'{"a": true}')
+        parsed = entries(tape)
+        assert len(parsed) == 3
+        assert parsed[0][0] & 0xFF == TAG_OBJECT
+        assert parsed[1][0] & 0xFF == TAG_STRING
+        assert parsed[2][0] & 0xFF == TAG_TRUE
+
+    def test_string_offsets(self):
+        """
+        loads_tape() string entries hold pool offsets, not the bytes
+        """
+        tape = orjson.loads_tape(b'["abc", "de"]')
+        parsed = entries(tape)
+        first_tag, first_uni = parsed[1]
+        second_tag, second_uni = parsed[2]
+        assert first_tag & 0xFF == TAG_STRING
+        assert first_tag >> 8 == 3
+        assert second_tag & 0xFF == TAG_STRING
+        assert second_tag >> 8 == 2
+        # offsets into the parse buffer's string pool, strictly ordered
+        assert first_uni < second_uni
+
+    def test_deterministic(self):
+        """
+        loads_tape() identical input yields identical tapes across calls
+        """
+        doc = b'{"key": ["value", 1, null, 2.5], "other": "string"}'
+        assert orjson.loads_tape(doc) == orjson.loads_tape(doc)
+
+    def test_input_types(self):
+        """
+        loads_tape() accepts the same input types as loads()
+        """
+        doc = b'["a", {"b": 1}]'
+        tape = orjson.loads_tape(doc)
+        assert orjson.loads_tape(doc.decode("utf-8")) == tape
+        assert orjson.loads_tape(bytearray(doc)) == tape
+        assert orjson.loads_tape(memoryview(doc)) == tape
+
+    def test_invalid_document(self):
+        """
+        loads_tape() invalid JSON
+        """
+        with pytest.raises(orjson.JSONDecodeError):
+            orjson.loads_tape(b"[1,")
+
+    def test_invalid_type(self):
+        """
+        loads_tape() invalid input type
+        """
+        with pytest.raises(orjson.JSONDecodeError):
+            orjson.loads_tape([])